@@ -21,6 +21,12 @@ from .layers import LayerAndMaskInfo
 from . import util
 
 
+# Valid enumeration values, for fast membership tests in the setters
+_versions = frozenset(enums.Version)
+_color_depths = frozenset(enums.ColorDepth)
+_color_modes = frozenset(enums.ColorMode)
+
+
 class Header(object):
     """
     Manages the header at the start of a PSD/PSB file.
@@ -47,7 +53,7 @@ class Header(object):
 
     @version.setter
     def version(self, value):  # type: (int) -> None
-        if value not in list(enums.Version):  # type: ignore
+        if value not in _versions:
             raise ValueError("Invalid version.")
         self._version = value
 
@@ -103,7 +109,7 @@ class Header(object):
 
     @depth.setter
     def depth(self, value):  # type: (int) -> None
-        if value not in list(enums.ColorDepth):  # type: ignore
+        if value not in _color_depths:
             raise ValueError("Invalid depth")
         self._depth = value
 
@@ -114,7 +120,7 @@ class Header(object):
 
     @color_mode.setter
     def color_mode(self, value):  # type: (int) -> None
-        if value not in list(enums.ColorMode):  # type: ignore
+        if value not in _color_modes:
             raise ValueError("Invalid color mode.")
         self._color_mode = value
 
@@ -265,6 +271,7 @@ class PsdFile(Header):
     @classmethod
     @util.trace_read
     def read(cls, fd):  # type: (BinaryIO) -> PsdFile
+        util.advise_sequential(fd)
         self = cls.header_read(fd)
         self.color_mode_data = ColorModeData.read(fd, self)
         self.image_resources = ImageResources.read(fd, self)
@@ -9,26 +9,72 @@ The `ImageData` section.
 from __future__ import unicode_literals, absolute_import
 
 
+import os
 import struct
 
 
 import numpy as np  # NOQA
 
 
+import six
+
+
 from . import codecs
 from . import enums
 from . import util
 
 
-from typing import BinaryIO, Optional, Tuple, TYPE_CHECKING  # NOQA
+from typing import Any, BinaryIO, List, Optional, Tuple, TYPE_CHECKING  # NOQA
 if TYPE_CHECKING:
     from . import core  # NOQA
 
 
+# concurrent.futures is only available on Python 2 through the
+# ``futures`` backport.  Without it, `decode_batch` decodes everything
+# in the current process.
+try:
+    from concurrent.futures import ProcessPoolExecutor
+except ImportError:
+    ProcessPoolExecutor = None
+
+
+# Valid enumeration values, for fast membership tests in the setters
+_compressions = frozenset(enums.Compression)
+
+
+def _decompress_channels(data,          # type: bytes
+                         compression,   # type: int
+                         num_channels,  # type: int
+                         height,        # type: int
+                         width,         # type: int
+                         depth,         # type: int
+                         version        # type: int
+                         ):             # type: (...) -> np.ndarray
+    image = codecs.decompress_image(
+        data, compression, (height * num_channels, width), depth, version)
+    return image.reshape((num_channels, height, width))
+
+
+def _read_and_decompress_channels(filename,  # type: unicode
+                                  offset,    # type: int
+                                  size,      # type: int
+                                  *args      # type: int
+                                  ):         # type: (...) -> np.ndarray
+    with open(filename, 'rb') as fd:
+        fd.seek(offset)
+        data = fd.read(size)
+    return _decompress_channels(data, *args)
+
+
 class ImageData(object):
     """
     Stores (non-layer) image data.
     """
+    __slots__ = (
+        '_compression', '_channels', '_image', '_fd', '_offset', '_size',
+        '_height', '_width', '_num_channels', '_depth', '_version', '_shape'
+    )
+
     def __init__(self,
                  channels=None,      # type: Optional[np.ndarray]
                  fd=None,            # type: Optional[BinaryIO]
@@ -71,7 +117,7 @@ class ImageData(object):
 
     @compression.setter
     def compression(self, value):  # type: (int) -> None
-        if value not in list(enums.Compression):  # type: ignore
+        if value not in _compressions:
             raise ValueError("invalid compression type")
         self._compression = value
 
@@ -79,7 +125,7 @@ class ImageData(object):
         # type: (Optional[np.ndarray]) -> None
         if channels is None:
             return
-        if len(channels.shape) != 3:
+        if channels.ndim != 3:
             raise ValueError("image must be a 3-dimensional array")
         if channels.dtype.kind != 'u':
             raise ValueError("image must have unsigned integer data type")
@@ -102,12 +148,9 @@ class ImageData(object):
         self._fd.seek(self._offset)
         try:
             data = self._fd.read(self._size)
-            image = codecs.decompress_image(
-                data, self.compression,
-                (self._height * self._num_channels, self._width),
-                self._depth, self._version)
-            return image.reshape(
-                (self._num_channels, self._height, self._width))
+            return _decompress_channels(
+                data, self.compression, self._num_channels, self._height,
+                self._width, self._depth, self._version)
         finally:
             self._fd.seek(tell)
 
@@ -132,7 +175,8 @@ class ImageData(object):
             raise IOError("Unexpected end of file")
 
         compression_val = struct.unpack(str('>H'), compression)[0]
-        util.log("compression: {}", enums.Compression(compression_val))
+        if util.DEBUG:
+            util.log("compression: {}", enums.Compression(compression_val))
 
         offset = fd.tell()
         fd.seek(0, 2)
@@ -149,10 +193,10 @@ class ImageData(object):
         util.write_value(fd, 'H', self.compression)
 
         if self._fd is None:
-            if self.channels is None:
+            if self._channels is None:
                 channels = 0
             else:
-                channels = self.channels
+                channels = self._channels
             codecs.compress_image(
                 fd, channels, self.compression, header.shape,
                 header.num_channels, header.depth, header.version)
@@ -161,10 +205,84 @@ class ImageData(object):
                     self._size is None):
                 raise RuntimeError("Internal inconsistency")
 
-            tell = self._fd.tell()
-            try:
-                self._fd.seek(self._offset)
-                data = self._fd.read(self._size)
-            finally:
-                self._fd.seek(tell)
-            fd.write(data)
+            util.copy_bytes(self._fd, fd, self._offset, self._size)
+
+
+def _get_filename(fd):  # type: (Any) -> Optional[unicode]
+    # Worker processes can only reopen a regular file on disk: the
+    # name of a compressed or archive member wrapper does not refer to
+    # the PSD stream itself.
+    raw = util.get_raw_file(fd)
+    if raw is None:
+        return None
+    filename = raw.name
+    if not isinstance(filename, six.string_types):
+        return None
+    filename = os.path.abspath(filename)
+    # A relative name may no longer refer to the open file if the
+    # working directory has changed since it was opened.
+    try:
+        if not os.path.samestat(os.fstat(raw.fileno()), os.stat(filename)):
+            return None
+    except (OSError, ValueError):
+        return None
+    return filename
+
+
+def decode_batch(image_datas,     # type: List[ImageData]
+                 max_workers=None  # type: Optional[int]
+                 ):  # type: (...) -> List[np.ndarray]
+    """
+    Decode the channels of many `ImageData` sections in parallel.
+
+    Sections that were read from a regular file on disk are decoded
+    in a pool of worker processes, each of which reopens the file by
+    name.  All other sections, or all sections if
+    `concurrent.futures` is not available, are handled in the current
+    process.
+
+    Parameters
+    ----------
+    image_datas : list of ImageData
+        The sections to decode.
+
+    max_workers : int, optional
+        The maximum number of worker processes.  Defaults to the
+        number of processors on the machine.
+
+    Returns
+    -------
+    channels : list of numpy arrays
+        The value of `ImageData.channels` for each section, in the
+        same order as *image_datas*.
+    """
+    results = [None] * len(image_datas)  # type: List[Any]
+    jobs = []  # type: List[Tuple[int, unicode]]
+    for i, image_data in enumerate(image_datas):
+        if ProcessPoolExecutor is None:
+            filename = None
+        else:
+            filename = _get_filename(image_data._fd)
+        if filename is None:
+            results[i] = image_data.channels
+        else:
+            jobs.append((i, filename))
+
+    if not jobs:
+        return results
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = []
+        for i, filename in jobs:
+            image_data = image_datas[i]
+            futures.append(executor.submit(
+                _read_and_decompress_channels, filename,
+                image_data._offset, image_data._size,
+                image_data.compression, image_data._num_channels,
+                image_data._height, image_data._width,
+                image_data._depth, image_data._version))
+
+        for (i, filename), future in zip(jobs, futures):
+            results[i] = future.result()
+
+    return results
@@ -14,6 +14,10 @@ images, such as pen tool paths.
 from __future__ import unicode_literals, absolute_import
 
 
+import io
+import struct
+
+
 import six
 
 
@@ -30,6 +34,56 @@ if TYPE_CHECKING:
     from . import core  # NOQA
 
 
+try:
+    from . import _cyimage_resources  # type: ignore
+except ImportError:
+    _cyimage_resources = None
+
+
+# Precompiled structs for the fixed-size parts of resource blocks
+_block_prefix = struct.Struct(str('>4sH'))
+_block_header = struct.Struct(str('>4sHB'))
+_u8 = struct.Struct(str('>B'))
+_u32 = struct.Struct(str('>I'))
+_i32 = struct.Struct(str('>i'))
+_border_info = struct.Struct(str('>HHH'))
+_background_color = struct.Struct(str('>HHHHH'))
+_print_flags = struct.Struct(str('>9B'))
+_guide = struct.Struct(str('>IB'))
+_grid_and_guides_header = struct.Struct(str('>IIII'))
+_version_info_header = struct.Struct(str('>IB'))
+_print_scale = struct.Struct(str('>Hfff'))
+
+
+# Valid enumeration values, for fast membership tests in the setters
+_units = frozenset(enums.Units)
+_color_spaces = frozenset(enums.ColorSpace)
+_guide_directions = frozenset(enums.GuideDirection)
+_print_scale_styles = frozenset(enums.PrintScaleStyle)
+
+
+# Maps each `PrintFlags` bit field to its on-disk form, with each set
+# bit written as a 255 byte
+_print_flags_encode = [
+    _print_flags.pack(*[255 if bits & (1 << i) else 0 for i in range(9)])
+    for bits in range(1 << 9)
+]
+
+
+# Maps the on-disk form of `PrintFlags` back to its bit field, for
+# set bits written either as 1 or as 255
+_print_flags_decode = dict(
+    (_print_flags.pack(*[value if bits & (1 << i) else 0 for i in range(9)]),
+     bits)
+    for value in (1, 255)
+    for bits in range(1 << 9)
+)
+
+
+# The on-disk layout of an array of guides, matching `_guide`
+_guide_dtype = np.dtype([(str('location'), '>u4'), (str('direction'), 'u1')])
+
+
 class _ImageResourceBlockMeta(type):
     """
     A metaclass that builds a mapping of subclasses.
@@ -50,6 +104,10 @@ class _ImageResourceBlockMeta(type):
         return new_cls
 
 
+_block_classes = _ImageResourceBlockMeta.mapping
+_get_block_class = _block_classes.get
+
+
 @six.add_metaclass(_ImageResourceBlockMeta)
 class ImageResourceBlock(object):
     """
@@ -58,6 +116,8 @@ class ImageResourceBlock(object):
     ``pytoshop`` currently doesn't deeply parse image resource
     blocks.  The raw data is merely retained for round-tripping.
     """
+    __slots__ = ('_name', '_name_length')
+
     _resource_id = -1
 
     @property
@@ -74,6 +134,7 @@ class ImageResourceBlock(object):
                 len(value) > 255):
             raise ValueError("name must be unicode string of length < 255")
         self._name = value
+        self._name_length = util.pascal_string_length(value, 2)
 
     @property
     def resource_id(self):  # type: (...) -> int
@@ -82,14 +143,12 @@ class ImageResourceBlock(object):
 
     def length(self, header):  # type: (core.Header) -> int
         data_length = self.data_length(header)
-        length = (
+        # The data is padded to an even length
+        return (
             4 + 2 +
-            util.pascal_string_length(self.name, 2) +
-            4 + data_length
+            self._name_length +
+            4 + data_length + (data_length & 1)
         )
-        if data_length % 2 != 0:
-            length += 1
-        return length
     length.__doc__ = docs.length  # type: ignore
 
     def total_length(self, header):  # type: (core.Header) -> int
@@ -99,26 +158,56 @@ class ImageResourceBlock(object):
     def data_length(self, header):  # type: (core.Header) -> int
         raise NotImplementedError()
 
+    @classmethod
+    def _from_trusted(cls, name, **kwargs):
+        # type: (unicode, **Any) -> ImageResourceBlock
+        # Creates a block from values that are valid by construction,
+        # such as those just unpacked from a file, without running the
+        # validating property setters.
+        self = cls.__new__(cls)
+        self._name = name
+        self._name_length = util.pascal_string_length(name, 2)
+        for key, value in kwargs.items():
+            setattr(self, '_' + key, value)
+        return self
+
     @classmethod
     @util.trace_read
     def read(cls, fd, header):
         # type: (BinaryIO, core.Header) -> ImageResourceBlock
-        signature = fd.read(4)
+        if _cyimage_resources is not None and not util.DEBUG:
+            return _cyimage_resources.read_block(
+                fd, header, _block_classes, GenericImageResourceBlock)
+        return cls._read(fd, header)
+    read.__func__.__doc__ = docs.read  # type: ignore
+
+    @classmethod
+    def _read(cls, fd, header):
+        # type: (BinaryIO, core.Header) -> ImageResourceBlock
+        # Truncated input raises the same errors as the compiled reader
+        prefix = fd.read(_block_header.size)
+        if len(prefix) != _block_header.size:
+            raise ValueError('Invalid image resource block signature')
+        signature, resource_id, name_length = _block_header.unpack(prefix)
         if signature != b'8BIM':
             raise ValueError('Invalid image resource block signature')
 
-        resource_id = util.read_value(fd, 'H')
-        name = util.read_pascal_string(fd, 2)
-
-        data_length = util.read_value(fd, 'I')
-
-        util.log(
-            "resource_id: {}, name: {}, data_length: {}",
-            resource_id, name, data_length
-        )
+        # The name is a Pascal string padded to an even length, including
+        # its length byte.  Read it along with the 4-byte data length.
+        name_size = name_length + 1 - (name_length & 1)
+        rest = fd.read(name_size + 4)
+        if len(rest) != name_size + 4:
+            raise ValueError('Unexpected end of file')
+        name = rest[:name_length].decode('utf8', 'replace')
+        data_length = _u32.unpack_from(rest, name_size)[0]
+
+        if util.DEBUG:
+            util.log(
+                "resource_id: {}, name: {}, data_length: {}",
+                resource_id, name, data_length
+            )
 
-        new_cls = _ImageResourceBlockMeta.mapping.get(
-            resource_id, GenericImageResourceBlock)
+        new_cls = _get_block_class(resource_id, GenericImageResourceBlock)
         start = fd.tell()
         result = new_cls.read_data(fd, resource_id, name, data_length, header)
         end = fd.tell()
@@ -129,7 +218,6 @@ class ImageResourceBlock(object):
             fd.read(1)
 
         return result
-    read.__func__.__doc__ = docs.read  # type: ignore
 
     @classmethod
     def read_data(cls,
@@ -144,11 +232,10 @@ class ImageResourceBlock(object):
     @util.trace_write
     def write(self, fd, header):
         # type: (BinaryIO, core.Header) -> None
-        fd.write(b'8BIM')
-        util.write_value(fd, 'H', self.resource_id)
+        fd.write(_block_prefix.pack(b'8BIM', self.resource_id))
         util.write_pascal_string(fd, self.name, 2)
         length = self.data_length(header)
-        util.write_value(fd, 'I', length)
+        fd.write(_u32.pack(length))
         start = fd.tell()
         self.write_data(fd, header)
         end = fd.tell()
@@ -165,6 +252,8 @@ class ImageResourceBlock(object):
 
 
 class GenericImageResourceBlock(ImageResourceBlock):
+    __slots__ = ('_resource_id', '_data')
+
     def __init__(self, name='', resource_id=0, data=b''):
         self.name = name
         self.resource_id = resource_id
@@ -190,10 +279,12 @@ class GenericImageResourceBlock(ImageResourceBlock):
         return self._data
 
     @data.setter
-    def data(self, value):  # type: (bytes) -> None
-        if (not isinstance(value, bytes) or
+    def data(self, value):  # type: (Union[bytes, memoryview]) -> None
+        if (not isinstance(value, (bytes, bytearray, memoryview)) or
                 len(value) > (1 << 32)):
             raise ValueError("data must be a byte string")
+        if not isinstance(value, bytes):
+            value = memoryview(value).tobytes()
         self._data = value
 
     @classmethod
@@ -204,8 +295,8 @@ class GenericImageResourceBlock(ImageResourceBlock):
                   length,       # type: int
                   header        # type: core.Header
                   ):            # type: (...) -> ImageResourceBlock
-        data = fd.read(length)
-        return cls(resource_id=resource_id, name=name, data=data)
+        return cls._from_trusted(
+            name, resource_id=resource_id, data=fd.read(length))
 
     def data_length(self, header):  # type: (core.Header) -> int
         return len(self.data)
@@ -216,6 +307,8 @@ class GenericImageResourceBlock(ImageResourceBlock):
 
 
 class ImageResourceUnicodeString(ImageResourceBlock):
+    __slots__ = ('_value', '_encoded_value')
+
     def __init__(self,
                  name='',  # type: unicode
                  value=''  # type: unicode
@@ -233,6 +326,7 @@ class ImageResourceUnicodeString(ImageResourceBlock):
                 len(value) > (1 << 32)):
             raise TypeError("value must be a unicode string")
         self._value = value
+        self._encoded_value = util.encode_unicode_string(value)
 
     @classmethod
     def read_data(cls,
@@ -249,11 +343,11 @@ class ImageResourceUnicodeString(ImageResourceBlock):
         )
 
     def data_length(self, header):  # type: (core.Header) -> int
-        return util.unicode_string_length(self.value)
+        return len(self._encoded_value)
 
     def write_data(self, fd, header):
         # type: (BinaryIO, core.Header) -> None
-        fd.write(util.encode_unicode_string(self.value))
+        fd.write(self._encoded_value)
 
 
 class LayersGroupInfo(ImageResourceBlock):
@@ -262,6 +356,8 @@ class LayersGroupInfo(ImageResourceBlock):
 
     Indicates which layers are locked together.
     """
+    __slots__ = ('_group_ids',)
+
     def __init__(self,
                  name='',      # type: unicode
                  group_ids=[]  # type: List[int]
@@ -277,7 +373,7 @@ class LayersGroupInfo(ImageResourceBlock):
 
     @group_ids.setter
     def group_ids(self, value):  # type: (List[int]) -> None
-        util.assert_is_list_of(value, int, min=0, max=65535)
+        util.assert_is_list_of_ints(value, 0, 65535)
         self._group_ids = value
 
     @classmethod
@@ -290,21 +386,23 @@ class LayersGroupInfo(ImageResourceBlock):
                   ):            # type: (...) -> ImageResourceBlock
         data = fd.read(length)
         group_ids = np.frombuffer(data, '>u2').tolist()
-        return cls(name=name, group_ids=group_ids)
+        return cls._from_trusted(name, group_ids=group_ids)
 
     def data_length(self, header):  # type: (core.Header) -> int
-        return len(self.group_ids * 2)
+        return len(self.group_ids) * 2
 
     def write_data(self, fd, header):
         # type: (BinaryIO, core.Header) -> None
-        data = np.array(self.group_ids, '>u2').tobytes()
-        fd.write(data)
+        group_ids = self.group_ids
+        fd.write(struct.pack(str('>%dH') % len(group_ids), *group_ids))
 
 
 class BorderInfo(ImageResourceBlock):
     """
     Border information.
     """
+    __slots__ = ('_border_width_num', '_border_width_den', '_unit')
+
     def __init__(self,
                  name='',                 # type: unicode
                  border_width_num=0,      # type: int
@@ -353,7 +451,7 @@ class BorderInfo(ImageResourceBlock):
 
     @unit.setter
     def unit(self, value):  # type: (int) -> None
-        if value not in list(enums.Units):  # type: ignore
+        if value not in _units:
             raise ValueError("Invalid unit.")
         self._unit = value
 
@@ -365,26 +463,28 @@ class BorderInfo(ImageResourceBlock):
                   length,       # type: int
                   header        # type: core.Header
                   ):            # type: (...) -> ImageResourceBlock
-        num, den, unit = util.read_value(fd, 'HHH')
-        return cls(
-            name=name, border_width_num=num, border_width_den=den,
-            unit=unit)
+        num, den, unit = util.read_struct(fd, _border_info)
+        result = cls._from_trusted(
+            name, border_width_num=num, border_width_den=den)
+        # The unit may be any 16-bit value, so still needs validating
+        result.unit = unit
+        return result
 
     def data_length(self, header):  # type: (core.Header) -> int
         return 6
 
     def write_data(self, fd, header):
         # type: (BinaryIO, core.Header) -> None
-        util.write_value(
-            fd, 'HHH', self.border_width_num,
-            self.border_width_den, self.unit
-        )
+        fd.write(_border_info.pack(
+            self.border_width_num, self.border_width_den, self.unit))
 
 
 class BackgroundColor(ImageResourceBlock):
     """
     Background color.
     """
+    __slots__ = ('_color_space', '_color')
+
     def __init__(self,
                  name='',                           # type: unicode
                  color_space=enums.ColorSpace.rgb,  # type: int
@@ -403,7 +503,7 @@ class BackgroundColor(ImageResourceBlock):
 
     @color_space.setter
     def color_space(self, value):  # type: (int) -> None
-        if value not in list(enums.ColorSpace):  # type: ignore
+        if value not in _color_spaces:
             raise ValueError("Invalid color space.")
         self._color_space = value
 
@@ -431,34 +531,32 @@ class BackgroundColor(ImageResourceBlock):
                   length,       # type: int
                   header        # type: core.Header
                   ):            # type: (...) -> ImageResourceBlock
-        space_id, a, b, c, d = util.read_value(fd, 'HHHHH')
+        space_id, a, b, c, d = util.read_struct(fd, _background_color)
         if space_id == enums.ColorSpace.lab:
             b -= 32767
             c -= 32767
-        return cls(
-            name=name, color_space=space_id, color=[a, b, c, d]
-        )
+        result = cls._from_trusted(name, color=[a, b, c, d])
+        result.color_space = space_id
+        return result
 
     def data_length(self, header):  # type: (core.Header) -> int
         return 10
 
     def write_data(self, fd, header):
         # type: (BinaryIO, core.Header) -> None
-        color = self.color[:]
-        color.extend([0] * (4 - len(color)))
-        a, b, c, d = color
+        a, b, c, d = (tuple(self.color) + (0, 0, 0))[:4]
         if self.color_space == enums.ColorSpace.lab:
             b += 32767
             c += 32767
-        util.write_value(
-            fd, 'HHHHH', self.color_space, a, b, c, d
-        )
+        fd.write(_background_color.pack(self.color_space, a, b, c, d))
 
 
 class PrintFlags(ImageResourceBlock):
     """
     Print flags.
     """
+    __slots__ = ('_bits',)
+
     def __init__(self,
                  name='',                   # type: unicode
                  labels=False,              # type: bool
@@ -472,6 +570,7 @@ class PrintFlags(ImageResourceBlock):
                  print_flags=False          # type: bool
                  ):  # type: (...) -> None
         self.name = name
+        self._bits = 0
         self.labels = labels
         self.crop_marks = crop_marks
         self.color_bars = color_bars
@@ -484,86 +583,94 @@ class PrintFlags(ImageResourceBlock):
 
     _resource_id = enums.ImageResourceID.print_flags
 
+    # The flags are stored as a bit field, in file order, so they can
+    # be read and written without handling each one separately.
+    def _set_bit(self, mask, value):  # type: (int, Any) -> None
+        if value:
+            self._bits |= mask
+        else:
+            self._bits &= ~mask
+
     @property
     def labels(self):  # type: (...) -> bool
         "labels"
-        return self._labels
+        return bool(self._bits & 1)
 
     @labels.setter
     def labels(self, value):  # type: (Any) -> None
-        self._labels = bool(value)
+        self._set_bit(1, value)
 
     @property
     def crop_marks(self):  # type: (...) -> bool
         "crop marks"
-        return self._crop_marks
+        return bool(self._bits & 2)
 
     @crop_marks.setter
     def crop_marks(self, value):  # type: (Any) -> None
-        self._crop_marks = bool(value)
+        self._set_bit(2, value)
 
     @property
     def color_bars(self):  # type: (...) -> bool
         "color bars"
-        return self._color_bars
+        return bool(self._bits & 4)
 
     @color_bars.setter
     def color_bars(self, value):  # type: (Any) -> None
-        self._color_bars = bool(value)
+        self._set_bit(4, value)
 
     @property
     def registration_marks(self):  # type: (...) -> bool
         "registration marks"
-        return self._registration_marks
+        return bool(self._bits & 8)
 
     @registration_marks.setter
     def registration_marks(self, value):  # type: (Any) -> None
-        self._registration_marks = bool(value)
+        self._set_bit(8, value)
 
     @property
     def negative(self):  # type: (...) -> bool
         "negative"
-        return self._negative
+        return bool(self._bits & 16)
 
     @negative.setter
     def negative(self, value):  # type: (Any) -> None
-        self._negative = bool(value)
+        self._set_bit(16, value)
 
     @property
     def flip(self):  # type: (...) -> bool
         "flip"
-        return self._flip
+        return bool(self._bits & 32)
 
     @flip.setter
     def flip(self, value):  # type: (Any) -> None
-        self._flip = bool(value)
+        self._set_bit(32, value)
 
     @property
     def interpolate(self):  # type: (...) -> bool
         "interpolate"
-        return self._interpolate
+        return bool(self._bits & 64)
 
     @interpolate.setter
     def interpolate(self, value):  # type: (Any) -> None
-        self._interpolate = bool(value)
+        self._set_bit(64, value)
 
     @property
     def caption(self):  # type: (...) -> bool
         "caption"
-        return self._caption
+        return bool(self._bits & 128)
 
     @caption.setter
     def caption(self, value):  # type: (Any) -> None
-        self._caption = bool(value)
+        self._set_bit(128, value)
 
     @property
     def print_flags(self):  # type: (...) -> bool
         "print flags"
-        return self._print_flags
+        return bool(self._bits & 256)
 
     @print_flags.setter
     def print_flags(self, value):  # type: (Any) -> None
-        self._print_flags = bool(value)
+        self._set_bit(256, value)
 
     @classmethod
     def read_data(cls,
@@ -573,30 +680,23 @@ class PrintFlags(ImageResourceBlock):
                   length,       # type: int
                   header        # type: core.Header
                   ):            # type: (...) -> ImageResourceBlock
-        vals = util.read_value(fd, 'BBBBBBBBB')
-        vals = [bool(x) for x in vals]
-        return cls(
-            name=name, labels=vals[0], crop_marks=vals[1],
-            color_bars=vals[2], registration_marks=vals[3],
-            negative=vals[4], flip=vals[5], interpolate=vals[6],
-            caption=vals[7], print_flags=vals[8]
-        )
+        data = fd.read(9)
+        bits = _print_flags_decode.get(data)
+        if bits is None:
+            bits = util.pack_bitflags(*_print_flags.unpack(data))
+        return cls._from_trusted(name, bits=bits)
 
     def data_length(self, header):  # type: (core.Header) -> int
         return 9
 
     def write_data(self, fd, header):
         # type: (BinaryIO, core.Header) -> None
-        vals = [
-            self.labels, self.crop_marks, self.color_bars,
-            self.registration_marks, self.negative, self.flip,
-            self.interpolate, self.caption, self.print_flags
-        ]
-        int_vals = [(x and 255 or 0) for x in vals]
-        util.write_value(fd, 'BBBBBBBBB', *int_vals)
+        fd.write(_print_flags_encode[self._bits])
 
 
 class GuideResourceBlock(object):
+    __slots__ = ('_location', '_direction')
+
     def __init__(self,
                  location=0,  # type: int
                  direction=enums.GuideDirection.vertical  # type: int
@@ -623,7 +723,7 @@ class GuideResourceBlock(object):
 
     @direction.setter
     def direction(self, value):  # type: (int) -> None
-        if value not in list(enums.GuideDirection):  # type: ignore
+        if value not in _guide_directions:
             raise ValueError("Invalid guide direction")
         self._direction = value
 
@@ -631,13 +731,13 @@ class GuideResourceBlock(object):
     @util.trace_read
     def read(cls, fd, header):
         # type: (BinaryIO, core.Header) -> GuideResourceBlock
-        location, direction = util.read_value(fd, 'IB')
+        location, direction = util.read_struct(fd, _guide)
         return cls(location=location, direction=direction)
 
     @util.trace_write
     def write(self, fd, header):
         # type: (BinaryIO, core.Header) -> None
-        util.write_value(fd, 'IB', self.location, self.direction)
+        fd.write(_guide.pack(self.location, self.direction))
 
     def data_length(self, header):  # type: (core.Header) -> int
         return 5
@@ -647,6 +747,8 @@ class GridAndGuidesInfo(ImageResourceBlock):
     """
     Grid and guides resource.
     """
+    __slots__ = ('_grid_hori', '_grid_vert', '_guides', '_guide_data')
+
     def __init__(self,
                  name='',      # type: unicode
                  grid_hori=0,  # type: int
@@ -691,12 +793,28 @@ class GridAndGuidesInfo(ImageResourceBlock):
     @property
     def guides(self):  # type: (...) -> List[GuideResourceBlock]
         "Guides.  See `GuideResourceBlock`."
+        if self._guides is None:
+            # Guides read from a file are kept in their raw form until
+            # they are needed.
+            self._guides = [
+                GuideResourceBlock(location=location, direction=direction)
+                for (location, direction) in self._guide_data.tolist()
+            ]
+            self._guide_data = None
         return self._guides
 
     @guides.setter
     def guides(self, value):  # type: (List[GuideResourceBlock]) -> None
         util.assert_is_list_of(value, GuideResourceBlock)
         self._guides = value
+        self._guide_data = None
+
+    def _get_guide_data(self):  # type: (...) -> np.ndarray
+        if self._guides is None:
+            return self._guide_data
+        return np.array(
+            [(guide.location, guide.direction) for guide in self._guides],
+            dtype=_guide_dtype)
 
     @classmethod
     def read_data(cls,
@@ -706,35 +824,39 @@ class GridAndGuidesInfo(ImageResourceBlock):
                   length,       # type: int
                   header        # type: core.Header
                   ):            # type: (...) -> ImageResourceBlock
-        version, grid_hori, grid_vert, nguides = util.read_value(
-            fd, 'IIII')
+        version, grid_hori, grid_vert, nguides = util.read_struct(
+            fd, _grid_and_guides_header)
         if version != 1:
             raise ValueError(
                 "Unknown version {} in grid and guides info block.".format(
                     version))
-        guides = []
-        for i in range(nguides):
-            guides.append(GuideResourceBlock.read(fd, header))
-        return cls(
-            name=name, grid_hori=grid_hori, grid_vert=grid_vert,
-            guides=guides
-        )
+        guide_data = np.frombuffer(
+            fd.read(_guide_dtype.itemsize * nguides), _guide_dtype, nguides)
+        if not np.isin(
+                guide_data['direction'], list(_guide_directions)).all():
+            raise ValueError("Invalid guide direction")
+        return cls._from_trusted(
+            name, grid_hori=grid_hori, grid_vert=grid_vert, guides=None,
+            guide_data=guide_data)
 
     def data_length(self, header):  # type: (core.Header) -> int
-        return 16 + (5 * len(self.guides))
+        if self._guides is None:
+            nguides = len(self._guide_data)
+        else:
+            nguides = len(self._guides)
+        return 16 + (_guide_dtype.itemsize * nguides)
 
     def write_data(self, fd, header):
         # type: (BinaryIO, core.Header) -> None
-        util.write_value(
-            fd, 'IIII', self.version,
-            self.grid_hori, self.grid_vert,
-            len(self.guides)
-        )
-        for guide in self.guides:
-            guide.write(fd, header)
+        guide_data = self._get_guide_data()
+        fd.write(_grid_and_guides_header.pack(
+            self.version, self.grid_hori, self.grid_vert, len(guide_data)))
+        fd.write(guide_data.tobytes())
 
 
 class CopyrightFlag(ImageResourceBlock):
+    __slots__ = ('_copyright',)
+
     def __init__(self,
                  name='',         # type: unicode
                  copyright=False  # type: bool
@@ -761,20 +883,21 @@ class CopyrightFlag(ImageResourceBlock):
                   length,       # type: int
                   header        # type: core.Header
                   ):            # type: (...) -> ImageResourceBlock
-        copyright = bool(util.read_value(fd, 'B'))
-        return cls(
-            name=name, copyright=copyright
-        )
+        copyright = bool(util.read_struct(fd, _u8)[0])
+        return cls._from_trusted(name, copyright=copyright)
 
     def data_length(self, header):  # type: (core.Header) -> int
         return 1
 
     def write_data(self, fd, header):
         # type: (BinaryIO, core.Header) -> None
-        util.write_value(fd, 'B', self.copyright and 255 or 0)
+        # True is written as 255, False as 0
+        fd.write(_u8.pack(-self.copyright & 0xff))
 
 
 class Url(ImageResourceBlock):
+    __slots__ = ('_url',)
+
     def __init__(self,
                  name='',  # type: unicode
                  url=b''   # type: bytes
@@ -790,9 +913,11 @@ class Url(ImageResourceBlock):
         return self._url
 
     @url.setter
-    def url(self, value):  # type: (bytes) -> None
-        if not isinstance(value, bytes):
+    def url(self, value):  # type: (Union[bytes, memoryview]) -> None
+        if not isinstance(value, (bytes, bytearray, memoryview)):
             raise TypeError("url must be bytes string")
+        if not isinstance(value, bytes):
+            value = memoryview(value).tobytes()
         self._url = value
 
     @classmethod
@@ -803,10 +928,7 @@ class Url(ImageResourceBlock):
                   length,       # type: int
                   header        # type: core.Header
                   ):            # type: (...) -> ImageResourceBlock
-        url = fd.read(length)
-        return cls(
-            name=name, url=url
-        )
+        return cls._from_trusted(name, url=fd.read(length))
 
     def data_length(self, header):  # type: (core.Header) -> int
         return len(self.url)
@@ -817,6 +939,8 @@ class Url(ImageResourceBlock):
 
 
 class GlobalAngle(ImageResourceBlock):
+    __slots__ = ('_angle',)
+
     def __init__(self,
                  name='',  # type: unicode
                  angle=0   # type: int
@@ -848,20 +972,20 @@ class GlobalAngle(ImageResourceBlock):
                   length,       # type: int
                   header        # type: core.Header
                   ):            # type: (...) -> ImageResourceBlock
-        angle = util.read_value(fd, 'i')
-        return cls(
-            name=name, angle=angle
-        )
+        angle = util.read_struct(fd, _i32)[0]
+        return cls._from_trusted(name, angle=angle)
 
     def data_length(self, header):  # type: (core.Header) -> int
         return 4
 
     def write_data(self, fd, header):
         # type: (BinaryIO, core.Header) -> None
-        util.write_value(fd, 'i', self.angle)
+        fd.write(_i32.pack(self.angle))
 
 
 class EffectsVisible(ImageResourceBlock):
+    __slots__ = ('_visible',)
+
     def __init__(self,
                  name='',       # type: unicode
                  visible=False  # type: bool
@@ -888,20 +1012,21 @@ class EffectsVisible(ImageResourceBlock):
                   length,       # type: int
                   header        # type: core.Header
                   ):            # type: (...) -> ImageResourceBlock
-        visible = bool(util.read_value(fd, 'B'))
-        return cls(
-            name=name, visible=visible
-        )
+        visible = bool(util.read_struct(fd, _u8)[0])
+        return cls._from_trusted(name, visible=visible)
 
     def data_length(self, header):  # type: (core.Header) -> int
         return 1
 
     def write_data(self, fd, header):
         # type: (BinaryIO, core.Header) -> None
-        util.write_value(fd, 'B', self.visible and 255 or 0)
+        # True is written as 255, False as 0
+        fd.write(_u8.pack(-self.visible & 0xff))
 
 
 class DocumentSpecificIdsSeedNumber(ImageResourceBlock):
+    __slots__ = ('_base_value',)
+
     def __init__(self,
                  name='',      # type: unicode
                  base_value=0  # type: int
@@ -931,24 +1056,26 @@ class DocumentSpecificIdsSeedNumber(ImageResourceBlock):
                   length,       # type: int
                   header        # type: core.Header
                   ):            # type: (...) -> ImageResourceBlock
-        base_value = bool(util.read_value(fd, 'I'))
-        return cls(
-            name=name, base_value=base_value
-        )
+        base_value = util.read_struct(fd, _u32)[0]
+        return cls._from_trusted(name, base_value=base_value)
 
     def data_length(self, header):  # type: (core.Header) -> int
         return 4
 
     def write_data(self, fd, header):
         # type: (BinaryIO, core.Header) -> None
-        util.write_value(fd, 'I', self.base_value)
+        fd.write(_u32.pack(self.base_value))
 
 
 class UnicodeAlphaNames(ImageResourceUnicodeString):
+    __slots__ = ()
+
     _resource_id = enums.ImageResourceID.unicode_alpha_names
 
 
 class GlobalAltitude(ImageResourceBlock):
+    __slots__ = ('_altitude',)
+
     def __init__(self,
                  name='',    # type: unicode
                  altitude=0  # type: int
@@ -978,24 +1105,26 @@ class GlobalAltitude(ImageResourceBlock):
                   length,       # type: int
                   header        # type: core.Header
                   ):            # type: (...) -> ImageResourceBlock
-        altitude = util.read_value(fd, 'I')
-        return cls(
-            name=name, altitude=altitude
-        )
+        altitude = util.read_struct(fd, _u32)[0]
+        return cls._from_trusted(name, altitude=altitude)
 
     def data_length(self, header):  # type: (core.Header) -> int
         return 4
 
     def write_data(self, fd, header):
         # type: (BinaryIO, core.Header) -> None
-        util.write_value(fd, 'I', self.altitude)
+        fd.write(_u32.pack(self.altitude))
 
 
 class WorkflowUrl(ImageResourceUnicodeString):
+    __slots__ = ()
+
     _resource_id = enums.ImageResourceID.workflow_url
 
 
 class AlphaIdentifiers(ImageResourceBlock):
+    __slots__ = ('_identifiers',)
+
     def __init__(self,
                  name='',        # type: unicode
                  identifiers=[]  # type: List[int]
@@ -1012,7 +1141,7 @@ class AlphaIdentifiers(ImageResourceBlock):
 
     @identifiers.setter
     def identifiers(self, value):  # type: (List[int]) -> None
-        util.assert_is_list_of(value, int, min=0, max=(1 << 32))
+        util.assert_is_list_of_ints(value, 0, (1 << 32) - 1)
         self._identifiers = value
 
     @classmethod
@@ -1023,24 +1152,28 @@ class AlphaIdentifiers(ImageResourceBlock):
                   length,       # type: int
                   header        # type: core.Header
                   ):            # type: (...) -> ImageResourceBlock
-        length = util.read_value(fd, 'I')
+        length = util.read_struct(fd, _u32)[0]
         buf = fd.read(4 * length)
-        identifiers = list(np.frombuffer(buf, np.uint32))
-        return cls(
-            name=name, identifiers=identifiers
-        )
+        identifiers = np.frombuffer(buf, '>u4', length).tolist()
+        return cls._from_trusted(name, identifiers=identifiers)
 
     def data_length(self, header):  # type: (core.Header) -> int
         return 4 + (len(self.identifiers) * 4)
 
     def write_data(self, fd, header):
         # type: (BinaryIO, core.Header) -> None
-        util.write_value(fd, 'I', len(self.identifiers))
-        for identifier in self.identifiers:
-            util.write_value(fd, 'I', identifier)
+        identifiers = self.identifiers
+        fd.write(_u32.pack(len(identifiers)))
+        fd.write(struct.pack(
+            str('>%dI') % len(identifiers), *identifiers))
 
 
 class VersionInfo(ImageResourceBlock):
+    __slots__ = (
+        '_version', '_has_real_merged_data', '_writer', '_reader',
+        '_file_version', '_encoded_writer', '_encoded_reader'
+    )
+
     def __init__(self,
                  name='',                     # type: unicode
                  version=0,                   # type: int
@@ -1089,6 +1222,7 @@ class VersionInfo(ImageResourceBlock):
         if not isinstance(value, six.text_type):
             raise TypeError("writer must be a Unicode string")
         self._writer = value
+        self._encoded_writer = util.encode_unicode_string(value)
 
     @property
     def reader(self):  # type: (...) -> unicode
@@ -1100,6 +1234,7 @@ class VersionInfo(ImageResourceBlock):
         if not isinstance(value, six.text_type):
             raise TypeError("reader must be a Unicode string")
         self._reader = value
+        self._encoded_reader = util.encode_unicode_string(value)
 
     @property
     def file_version(self):  # type: (...) -> int
@@ -1121,33 +1256,42 @@ class VersionInfo(ImageResourceBlock):
                   length,       # type: int
                   header        # type: core.Header
                   ):            # type: (...) -> ImageResourceBlock
-        version, has_real_merged_data = util.read_value(fd, 'IB')
+        version, has_real_merged_data = util.read_struct(
+            fd, _version_info_header)
         has_real_merged_data = bool(has_real_merged_data)
         writer = util.read_unicode_string(fd)
         reader = util.read_unicode_string(fd)
-        file_version = util.read_value(fd, 'I')
-        return cls(
-            name=name, version=version,
-            has_real_merged_data=has_real_merged_data, writer=writer,
-            reader=reader, file_version=file_version
+        file_version = util.read_struct(fd, _u32)[0]
+        result = cls._from_trusted(
+            name, version=version,
+            has_real_merged_data=has_real_merged_data,
+            file_version=file_version
         )
+        result.writer = writer
+        result.reader = reader
+        return result
 
     def data_length(self, header):  # type: (core.Header) -> int
         return (
             4 + 1 +
-            util.unicode_string_length(self.writer) +
-            util.unicode_string_length(self.reader) +
+            len(self._encoded_writer) +
+            len(self._encoded_reader) +
             4)
 
     def write_data(self, fd, header):
         # type: (BinaryIO, core.Header) -> None
-        util.write_value(fd, 'IB', self.version, self.has_real_merged_data)
-        util.write_unicode_string(fd, self.writer)
-        util.write_unicode_string(fd, self.reader)
-        util.write_value(fd, 'I', self.file_version)
+        fd.write(b''.join([
+            _version_info_header.pack(
+                self.version, self.has_real_merged_data),
+            self._encoded_writer,
+            self._encoded_reader,
+            _u32.pack(self.file_version)
+        ]))
 
 
 class PrintScale(ImageResourceBlock):
+    __slots__ = ('_style', '_x', '_y', '_scale')
+
     def __init__(self,
                  name='',                               # type: unicode
                  style=enums.PrintScaleStyle.centered,  # type: int
@@ -1170,7 +1314,7 @@ class PrintScale(ImageResourceBlock):
 
     @style.setter
     def style(self, value):  # type: (int) -> None
-        if value not in list(enums.PrintScaleStyle):  # type: ignore
+        if value not in _print_scale_styles:
             raise ValueError("Invalid print scale style")
         self._style = value
 
@@ -1215,17 +1359,17 @@ class PrintScale(ImageResourceBlock):
                   length,       # type: int
                   header        # type: core.Header
                   ):            # type: (...) -> ImageResourceBlock
-        style, x, y, scale = util.read_value(fd, 'Hfff')
-        return cls(
-            name=name, style=style, x=x, y=y, scale=scale
-        )
+        style, x, y, scale = util.read_struct(fd, _print_scale)
+        result = cls._from_trusted(name, x=x, y=y, scale=scale)
+        result.style = style
+        return result
 
     def data_length(self, header):  # type: (core.Header) -> int
         return (2 + 4 + 4 + 4)
 
     def write_data(self, fd, header):
         # type: (BinaryIO, core.Header) -> None
-        util.write_value(fd, 'Hfff', self.style, self.x, self.y, self.scale)
+        fd.write(_print_scale.pack(self.style, self.x, self.y, self.scale))
 
 
 class ImageResources(object):
@@ -1269,26 +1413,77 @@ class ImageResources(object):
     @util.trace_read
     def read(cls, fd, header):
         # type: (BinaryIO, core.Header) -> ImageResources
-        length = util.read_value(fd, 'I')
-        end = fd.tell() + length
+        length = util.read_struct(fd, _u32)[0]
 
-        util.log("length: {}, end: {}", length, end)
+        util.log("length: {}", length)
+
+        # Resource blocks are small and numerous, so read the whole
+        # section at once and parse it from memory
+        return cls._read_blocks(fd.read(length), length, header)
+    read.__func__.__doc__ = docs.read
+
+    @classmethod
+    def from_bytes(cls, data, header):
+        # type: (bytes, core.Header) -> ImageResources
+        """
+        Instantiate from a byte string.
+
+        Parameters
+        ----------
+        data : bytes
+            The image resources section, including its length header,
+            as produced by `to_bytes`.
+
+        header : PsdFile object
+            An object to get global file information from.
+        """
+        length = _u32.unpack_from(data)[0]
+        return cls._read_blocks(data[4:4 + length], length, header)
+
+    @classmethod
+    def _read_blocks(cls, data, length, header):
+        # type: (bytes, int, core.Header) -> ImageResources
+        section = io.BytesIO(data)
 
         blocks = []
-        while fd.tell() < end:
-            blocks.append(ImageResourceBlock.read(fd, header))
+        while section.tell() < length:
+            blocks.append(ImageResourceBlock.read(section, header))
 
-        if fd.tell() != end:
+        if section.tell() != length:
             raise ValueError(
                 "read the wrong amount reading image resource blocks")
 
         return cls(blocks=blocks)
-    read.__func__.__doc__ = docs.read
 
     @util.trace_write
     def write(self, fd, header):
         # type: (BinaryIO, core.Header) -> None
-        util.write_value(fd, 'I', self.length(header))
-        for block in self.blocks:
-            block.write(fd, header)
+        data = self._write_blocks(header)
+        fd.write(_u32.pack(len(data)))
+        fd.write(data)
     write.__doc__ = docs.write
+
+    def to_bytes(self, header):  # type: (core.Header) -> bytes
+        """
+        Write to a byte string.
+
+        Parameters
+        ----------
+        header : PsdFile object
+            An object to get global file information from.
+
+        Returns
+        -------
+        data : bytes
+            The image resources section, including its length header.
+        """
+        data = self._write_blocks(header)
+        return _u32.pack(len(data)) + data
+
+    def _write_blocks(self, header):  # type: (core.Header) -> bytes
+        # Assemble the section in memory, so its length is known
+        # without a separate pass and it can be written in one call
+        section = io.BytesIO()
+        for block in self.blocks:
+            block.write(section, header)
+        return section.getvalue()
@@ -11,6 +11,7 @@ from __future__ import unicode_literals, absolute_import
 
 from collections import OrderedDict
 import os
+import struct
 
 
 import numpy as np
@@ -32,10 +33,33 @@ if TYPE_CHECKING:
     from . import core  # NOQA
 
 
+# Valid enumeration values, for fast membership tests in the setters
+_compressions = frozenset(enums.Compression)
+_blend_modes = frozenset(enums.BlendMode)
+_layer_mask_kinds = frozenset(enums.LayerMaskKind)
+_channel_ids = frozenset(enums.ChannelId)
+
+
+# Precompiled structs for the fixed-size parts of a layer mask
+_mask_header = struct.Struct(str('>iiiiBB'))
+_mask_real = struct.Struct(str('>BBiiii'))
+_f64 = struct.Struct(str('>d'))
+
+
 class LayerMask(object):
     """
     Layer mask / adjustment layer data.
     """
+    __slots__ = (
+        '_top', '_left', '_bottom', '_right', '_default_color',
+        '_position_relative_to_layer', '_layer_mask_disabled',
+        '_invert_layer_mask_when_blending',
+        '_user_mask_from_rendering_other_data', '_user_mask_density',
+        '_user_mask_feather', '_vector_mask_density', '_vector_mask_feather',
+        '_real_flags', '_real_user_mask_background', '_real_top',
+        '_real_left', '_real_bottom', '_real_right'
+    )
+
     def __init__(self,
                  top=0,                                      # type: int
                  left=0,                                     # type: int
@@ -343,15 +367,13 @@ class LayerMask(object):
         length = 16 + 1 + 1
         mask_flags = self._get_mask_flags()
         if mask_flags:
-            length += 1
-            if self.user_mask_density is not None:
-                length += 1
-            if self.user_mask_feather is not None:
-                length += 8
-            if self.vector_mask_density is not None:
-                length += 1
-            if self.vector_mask_feather is not None:
-                length += 8
+            # The flags byte, then a byte for each density and a
+            # double for each feather present.
+            length += (1 +
+                       (mask_flags & 1) +
+                       8 * ((mask_flags >> 1) & 1) +
+                       ((mask_flags >> 2) & 1) +
+                       8 * (mask_flags >> 3))
         length += 1 + 1 + 16
         return length
     length.__doc__ = docs.length  # type: ignore
@@ -361,11 +383,10 @@ class LayerMask(object):
     total_length.__doc__ = docs.total_length  # type: ignore
 
     def _get_mask_flags(self):  # type: (...) -> int
-        return util.pack_bitflags(
-            self.user_mask_density is not None,
-            self.user_mask_feather is not None,
-            self.vector_mask_density is not None,
-            self.vector_mask_feather is not None)
+        return ((self._user_mask_density is not None) |
+                (self._user_mask_feather is not None) << 1 |
+                (self._vector_mask_density is not None) << 2 |
+                (self._vector_mask_feather is not None) << 3)
 
     @classmethod
     @util.trace_read
@@ -378,7 +399,12 @@ class LayerMask(object):
         if length == 0:
             return cls(**d)
 
-        top, left, bottom, right = util.read_value(fd, 'iiii')
+        # The whole mask is only a few dozen bytes, so read it at once
+        # and unpack its fields from the buffer.
+        buf = fd.read(length)
+
+        top, left, bottom, right, default_color, flags = \
+            _mask_header.unpack_from(buf)
         d['top'] = top
         d['left'] = left
         d['bottom'] = bottom
@@ -386,47 +412,51 @@ class LayerMask(object):
 
         util.log("position: ({}, {}, {}, {})", top, left, bottom, right)
 
-        d['default_color'] = bool(util.read_value(fd, 'B'))
+        d['default_color'] = bool(default_color)
 
-        flags = util.read_value(fd, 'B')
-        (d['position_relative_to_layer'],
-         d['layer_mask_disabled'],
-         d['invert_layer_mask_when_blending'],
-         d['user_mask_from_rendering_other_data']) = util.unpack_bitflags(
-             flags, 4)
+        d['position_relative_to_layer'] = bool(flags & 1)
+        d['layer_mask_disabled'] = bool(flags & 2)
+        d['invert_layer_mask_when_blending'] = bool(flags & 4)
+        d['user_mask_from_rendering_other_data'] = bool(flags & 8)
 
         util.log("default_color: {}, flags: {}", d['default_color'], flags)
 
         if length == 20:
             util.log("done early")
-            fd.seek(end)
             return cls(**d)
 
+        offset = _mask_header.size
         if flags & 16:
-            mask_parameters = util.read_value(fd, 'B')
-            (has_user_mask_density,
-             has_user_mask_feather,
-             has_vector_mask_density,
-             has_vector_mask_feather) = util.unpack_bitflags(
-                 mask_parameters, 4)
-            if has_user_mask_density:
-                d['user_mask_density'] = util.read_value(fd, 'B')
-            if has_user_mask_feather:
-                d['user_mask_feather'] = util.read_value(fd, 'd')
-            if has_vector_mask_density:
-                d['vector_mask_density'] = util.read_value(fd, 'B')
-            if has_vector_mask_feather:
-                d['vector_mask_feather'] = util.read_value(fd, 'd')
-
-        d['real_flags'] = util.read_value(fd, 'B')
-        d['real_user_mask_background'] = bool(util.read_value(fd, 'B'))
+            mask_parameters = six.indexbytes(buf, offset)
+            offset += 1
+            if mask_parameters & 1:
+                d['user_mask_density'] = six.indexbytes(buf, offset)
+                offset += 1
+            if mask_parameters & 2:
+                d['user_mask_feather'] = _f64.unpack_from(buf, offset)[0]
+                offset += 8
+            if mask_parameters & 4:
+                d['vector_mask_density'] = six.indexbytes(buf, offset)
+                offset += 1
+            if mask_parameters & 8:
+                d['vector_mask_feather'] = _f64.unpack_from(buf, offset)[0]
+                offset += 8
+
+        # Some writers end the mask before the real flags and rectangle
+        if len(buf) - offset < _mask_real.size:
+            util.log("no real fields")
+            return cls(**d)
+
+        (real_flags, real_user_mask_background,
+         top, left, bottom, right) = _mask_real.unpack_from(buf, offset)
+        d['real_flags'] = real_flags
+        d['real_user_mask_background'] = bool(real_user_mask_background)
 
         util.log(
             "real_flags: {}, real_user_mask_background: {}",
             d['real_flags'], d['real_user_mask_background']
         )
 
-        top, left, bottom, right = util.read_value(fd, 'iiii')
         d['real_top'] = top
         d['real_left'] = left
         d['real_bottom'] = bottom
@@ -437,55 +467,41 @@ class LayerMask(object):
             top, left, bottom, right
         )
 
-        fd.seek(end)
-
         return cls(**d)
     read.__func__.__doc__ = docs.read
 
     @util.trace_write
     def write(self, fd, header):
         # type: (BinaryIO, core.Header) -> None
-        def write_rectangle(top, left, bottom, right):
-            util.write_value(fd, 'iiii', top, left, bottom, right)
-
-        def write_default_color(color):
-            if color:
-                util.write_value(fd, 'B', 255)
-            else:
-                util.write_value(fd, 'B', 0)
-
         util.write_value(fd, 'I', self.length(header))
 
-        write_rectangle(self.top, self.left, self.bottom, self.right)
-        write_default_color(self.default_color)
-
         mask_flags = self._get_mask_flags()
 
-        flags = util.pack_bitflags(
-            self.position_relative_to_layer,
-            self.layer_mask_disabled,
-            self.invert_layer_mask_when_blending,
-            self.user_mask_from_rendering_other_data,
-            mask_flags != 0)
+        flags = (self._position_relative_to_layer |
+                 self._layer_mask_disabled << 1 |
+                 self._invert_layer_mask_when_blending << 2 |
+                 self._user_mask_from_rendering_other_data << 3 |
+                 (mask_flags != 0) << 4)
 
-        util.write_value(fd, 'B', flags)
+        fd.write(_mask_header.pack(
+            self.top, self.left, self.bottom, self.right,
+            255 if self.default_color else 0, flags))
 
         if mask_flags:
             util.write_value(fd, 'B', mask_flags)
 
-            if self.user_mask_density is not None:
-                util.write_value(fd, 'B', self.user_mask_density)
-            if self.user_mask_feather is not None:
-                util.write_value(fd, 'd', self.user_mask_feather)
-            if self.vector_mask_density is not None:
-                util.write_value(fd, 'B', self.vector_mask_density)
-            if self.vector_mask_feather is not None:
-                util.write_value(fd, 'd', self.vector_mask_feather)
-
-        util.write_value(fd, 'B', self.real_flags)
-        write_default_color(self.real_user_mask_background)
-        write_rectangle(self.real_top, self.real_left,
-                        self.real_bottom, self.real_right)
+            if mask_flags & 1:
+                util.write_value(fd, 'B', self._user_mask_density)
+            if mask_flags & 2:
+                util.write_value(fd, 'd', self._user_mask_feather)
+            if mask_flags & 4:
+                util.write_value(fd, 'B', self._vector_mask_density)
+            if mask_flags & 8:
+                util.write_value(fd, 'd', self._vector_mask_feather)
+
+        fd.write(_mask_real.pack(
+            self.real_flags, 255 if self.real_user_mask_background else 0,
+            self.real_top, self.real_left, self.real_bottom, self.real_right))
     write.__doc__ = docs.write
 
 
@@ -493,6 +509,11 @@ class ChannelImageData(object):
     """
     A single plane of channel image data.
     """
+    __slots__ = (
+        '_compression', '_image', '_fd', '_offset', '_size', '_shape',
+        '_depth', '_version', '_decoded'
+    )
+
     def __init__(self,
                  image=None,    # type: Optional[np.ndarray]
                  fd=None,       # type: Optional[BinaryIO]
@@ -518,6 +539,7 @@ class ChannelImageData(object):
         self._shape = shape
         self._depth = depth
         self._version = version
+        self._decoded = None  # type: Optional[np.ndarray]
 
     @property
     def compression(self):  # type: (...) -> int
@@ -526,14 +548,23 @@ class ChannelImageData(object):
 
     @compression.setter
     def compression(self, value):  # type: (int) -> None
-        if value not in list(enums.Compression):  # type: ignore
+        if value not in _compressions:
             raise ValueError("Invalid compression type.")
         self._compression = value
 
     @property
     def image(self):  # type: (...) -> np.ndarray
+        """
+        The channel image.
+
+        When the channel was read from a file, it is decompressed on
+        first access and the result is kept for later accesses.  Use
+        `invalidate` to release it.
+        """
         if self._image is not None:
             return self._image
+        if self._decoded is not None:
+            return self._decoded
         if (self._fd is None or
                 self._offset is None or
                 self._size is None or
@@ -546,15 +577,26 @@ class ChannelImageData(object):
         try:
             self._fd.seek(self._offset)
             data = self._fd.read(self._size)
-            return codecs.decompress_image(
+            self._decoded = codecs.decompress_image(
                 data, self.compression,
                 self._shape, self._depth, self._version)
+            return self._decoded
         finally:
             self._fd.seek(tell)
 
     @image.setter
     def image(self, image):  # type: (np.ndarray) -> None
         self._image = image
+        self._decoded = None
+
+    def invalidate(self):  # type: (...) -> None
+        """
+        Release the decompressed image kept by `image`, if any.
+
+        The image will be read from the file again the next time it
+        is accessed.
+        """
+        self._decoded = None
 
     @property
     def shape(self):  # type: (...) -> Tuple[int, int]
@@ -581,7 +623,8 @@ class ChannelImageData(object):
              size     # type: int
              ):       # type: (...) -> ChannelImageData
         compression = util.read_value(fd, 'H')
-        util.log("compression: {}", enums.Compression(compression))
+        if util.DEBUG:
+            util.log("compression: {}", enums.Compression(compression))
         offset = fd.tell()
         fd.seek(size, 1)
 
@@ -609,13 +652,7 @@ class ChannelImageData(object):
                 raise RuntimeError("Inconsistent state")
 
             if header.version == self._version:
-                tell = self._fd.tell()
-                try:
-                    self._fd.seek(self._offset)
-                    data = self._fd.read(self._size)
-                finally:
-                    self._fd.seek(tell)
-                fd.write(data)
+                util.copy_bytes(self._fd, fd, self._offset, self._size)
             else:
                 codecs.compress_image(
                     fd, self.image, self.compression, shape, 1,
@@ -630,6 +667,15 @@ class LayerRecord(object):
 
     There is one of these per logical layer in the file.
     """
+    __slots__ = (
+        '_top', '_left', '_bottom', '_right', '_name', '_blend_mode',
+        '_opacity', '_clipping', '_transparency_protected', '_visible',
+        '_pixel_data_irrelevant', '_color_mode', '_channels', '_mask',
+        '_blending_ranges', '_blocks', '_fd', '_channel_ids',
+        '_channel_data_lengths', '_mask_offset', '_blending_ranges_offset',
+        'channel_lengths_offset'
+    )
+
     def __init__(self,
                  top=0,                              # type: int
                  left=0,                             # type: int
@@ -727,7 +773,7 @@ class LayerRecord(object):
 
     @blend_mode.setter
     def blend_mode(self, value):  # type: (bytes) -> None
-        if value not in list(enums.BlendMode):  # type: ignore
+        if value not in _blend_modes:
             raise ValueError("Invalid blend mode.")
         self._blend_mode = value
 
@@ -811,14 +857,15 @@ class LayerRecord(object):
             raise TypeError("channels must be a dict")
 
         for key, val in value.items():
-            enums.ChannelId(key)
+            if key not in _channel_ids:
+                raise ValueError(
+                    "{!r} is not a valid ChannelId".format(key))
 
             if not isinstance(val, ChannelImageData):
                 raise ValueError(
                     "Each channel must be ChannelImageData instance")
 
-        value = OrderedDict(
-            sorted([(k, v) for (k, v) in value.items()]))
+        value = OrderedDict(sorted(value.items()))
 
         self._channels = value
 
@@ -992,12 +1039,9 @@ class LayerRecord(object):
                     blend_mode_signature))
 
         clipping = bool(clipping)
-        (transparency_protected,
-         visible,
-         _,
-         _,
-         pixel_data_irrelevant) = util.unpack_bitflags(flags, 5)
-        visible = not visible
+        transparency_protected = bool(flags & 1)
+        visible = not (flags & 2)
+        pixel_data_irrelevant = bool(flags & 16)
 
         util.log(
             "blend_mode: {}, opacity: {}, clipping: {}, flags: {}",
@@ -1082,12 +1126,11 @@ class LayerRecord(object):
             fd.seek(6 * len(self.channels), 1)
         else:
             fd.seek(10 * len(self.channels), 1)
-        flags = util.pack_bitflags(
-            self.transparency_protected,
-            not self.visible,
-            False,
-            True,
-            self.pixel_data_irrelevant)
+        # Bit 3 is always set, to mark bit 4 as meaningful
+        flags = (self._transparency_protected |
+                 (not self._visible) << 1 |
+                 8 |
+                 self._pixel_data_irrelevant << 4)
         extra_length = (
             self.mask.total_length(header) +
             self.blending_ranges.total_length(header) +
@@ -1281,7 +1324,7 @@ class GlobalLayerMaskInfo(object):
 
     @kind.setter
     def kind(self, value):  # type: (int) -> None
-        if value not in list(enums.LayerMaskKind):  # type: ignore
+        if value not in _layer_mask_kinds:
             raise ValueError("Invalid layer mask kind")
         self._kind = value
 
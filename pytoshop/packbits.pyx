@@ -8,45 +8,6 @@ cimport cython
 import sys
 
 
-@cython.boundscheck(False)
-def decode_prediction_8bit(data):
-    cdef unsigned char [:] input = data
-    cdef int i
-
-    for i in range(input.shape[0] - 1):
-        input[i+1] += input[i]
-
-
-@cython.boundscheck(False)
-def decode_prediction_16bit(data):
-    cdef unsigned short [:] input = data
-
-    cdef int i
-
-    for i in range(input.shape[0] - 1):
-        input[i+1] += input[i]
-
-
-@cython.boundscheck(False)
-def encode_prediction_8bit(data):
-    cdef unsigned char [:] input = data
-
-    cdef int i
-
-    for i in range(input.shape[0] - 1, 0, -1):
-        input[i] -= input[i-1]
-
-
-@cython.boundscheck(False)
-def encode_prediction_16bit(data):
-    cdef unsigned short [:] input = data
-
-    cdef int i
-
-    for i in range(input.shape[0] - 1, 0, -1):
-        input[i] -= input[i-1]
-
-
 @cython.boundscheck(False)
 @cython.wraparound(False)
 cdef inline void decode_row(unsigned char *input,
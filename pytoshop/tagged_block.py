@@ -23,6 +23,11 @@ if TYPE_CHECKING:
     from . import core  # NOQA
 
 
+# Valid enumeration values, for fast membership tests in the setters
+_section_divider_settings = frozenset(enums.SectionDividerSetting)
+_blend_modes = frozenset(enums.BlendMode)
+
+
 class _TaggedBlockMeta(type):
     """
     A metaclass that builds a mapping of subclasses.
@@ -41,6 +46,9 @@ class _TaggedBlockMeta(type):
         return new_cls
 
 
+_get_block_class = _TaggedBlockMeta.mapping.get
+
+
 @six.add_metaclass(_TaggedBlockMeta)
 class TaggedBlock(object):
     _code = b'\0\0\0\0'
@@ -99,13 +107,13 @@ class TaggedBlock(object):
             length = util.read_value(fd, 'I')
         padded_length = util.pad(length, padding)
 
-        util.log(
-            "code: {}, length: {}, padded_length: {}",
-            code, length, padded_length
-        )
+        if util.DEBUG:
+            util.log(
+                "code: {}, length: {}, padded_length: {}",
+                code, length, padded_length
+            )
 
-        new_cls = _TaggedBlockMeta.mapping.get(  # type: ignore
-            code, GenericTaggedBlock)
+        new_cls = _get_block_class(code, GenericTaggedBlock)  # type: ignore
         start = fd.tell()
         result = new_cls.read_data(fd, code, length, header)
         end = fd.tell()
@@ -360,7 +368,7 @@ class _SectionDividerSetting(TaggedBlock):
 
     @type.setter
     def type(self, value):  # type: (int) -> None
-        if value not in list(enums.SectionDividerSetting):  # type: ignore
+        if value not in _section_divider_settings:
             raise ValueError("Invalid section divider setting")
         self._type = value
 
@@ -372,7 +380,7 @@ class _SectionDividerSetting(TaggedBlock):
     @key.setter
     def key(self, value):  # type: (Optional[bytes]) -> None
         if (value is not None and
-                value not in list(enums.BlendMode)):  # type: ignore
+                value not in _blend_modes):
             raise ValueError("Invalid blend mode")
         self._key = value
 
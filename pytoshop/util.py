@@ -10,21 +10,35 @@ from __future__ import unicode_literals, absolute_import
 
 
 from functools import wraps
+import io
+import os
 import struct
 import sys
 
 
+import numpy as np
+
+
 from . import enums
 
 
-from typing import Any, BinaryIO, Callable, List, Type, TYPE_CHECKING  # NOQA
-if TYPE_CHECKING:
-    import numpy as np  # NOQA
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple, Type, TYPE_CHECKING  # NOQA
 
 
 DEBUG = False
 
 
+# Compiled `struct.Struct` objects, keyed by their format string
+_structs = {}  # type: Dict[unicode, struct.Struct]
+
+
+def _get_struct(fmt):  # type: (unicode) -> struct.Struct
+    result = _structs.get(fmt)
+    if result is None:
+        result = _structs[fmt] = struct.Struct(str(fmt))
+    return result
+
+
 def read_value(fd, fmt, endian='>'):
     # type: (BinaryIO, unicode, unicode) -> Any
     """
@@ -51,15 +65,36 @@ def read_value(fd, fmt, endian='>'):
         If a single value, it is returned alone.  If multiple values,
         a tuple is returned.
     """
-    fmt = endian + fmt
-    size = struct.calcsize(fmt)  # type: ignore
-    result = struct.unpack(fmt, fd.read(size))  # type: ignore
+    compiled = _get_struct(endian + fmt)
+    result = compiled.unpack(fd.read(compiled.size))
     if len(result) == 1:
         return result[0]
     else:
         return result
 
 
+def read_struct(fd, fmt):
+    # type: (BinaryIO, struct.Struct) -> Tuple[Any, ...]
+    """
+    Read values from a file-like object using a precompiled
+    `struct.Struct`.
+
+    Parameters
+    ----------
+    fd : file-like object
+        Must be opened for reading, in binary mode.
+
+    fmt : struct.Struct
+        The precompiled struct describing the values to read.
+
+    Returns
+    -------
+    values : tuple
+        The values read from the file.
+    """
+    return fmt.unpack(fd.read(fmt.size))
+
+
 def write_value(fd, fmt, *value, **kwargs):
     """
     Write a single binary value to a file-like object.
@@ -81,8 +116,7 @@ def write_value(fd, fmt, *value, **kwargs):
         The endianness. Must be ``>`` or ``<``.  Default: ``>``.
     """
     endian = kwargs.get('endian', '>')
-    fmt = endian + fmt
-    fd.write(struct.pack(fmt, *value))
+    fd.write(_get_struct(endian + fmt).pack(*value))
 
 
 def pad(number, divisor):
@@ -178,12 +212,10 @@ def pascal_string_length(value, padding=1):
     length : int
         The length, in bytes.
     """
-    value = value.encode('utf8')
-
     if len(value) == 0:
         return padding
 
-    length = len(value)
+    length = len(value.encode('utf8'))
     padding = pad(length + 1, padding) - 1 - length
     return length + padding + 1
 
@@ -262,6 +294,118 @@ def unicode_string_length(value):
     return len(encode_unicode_string(value))
 
 
+def advise_sequential(fd):
+    # type: (BinaryIO) -> None
+    """
+    Hint to the operating system that a file will be read
+    sequentially, so it can read ahead more aggressively.
+
+    This does nothing when *fd* is not backed by a real file, or the
+    platform does not support `os.posix_fadvise`.
+
+    Parameters
+    ----------
+    fd : file-like object
+        Must be opened for reading, in binary mode.
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fileno = fd.fileno()
+    except (AttributeError, IOError, ValueError):
+        return
+    try:
+        os.posix_fadvise(fileno, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except OSError:
+        pass
+
+
+def get_raw_file(fd):
+    # type: (Any) -> Optional[io.FileIO]
+    """
+    Get the regular file underlying a file-like object.
+
+    Wrappers such as `gzip.GzipFile` or `bz2.BZ2File` also have a
+    ``fileno()``, but it refers to the compressed file, not the
+    stream they return, so they are not considered regular files.
+
+    Parameters
+    ----------
+    fd : file-like object
+
+    Returns
+    -------
+    raw : io.FileIO or None
+        The unbuffered file object, or `None` if *fd* is not backed
+        by a regular file.
+    """
+    raw = getattr(fd, 'raw', fd)
+    if isinstance(raw, io.FileIO):
+        return raw
+    return None
+
+
+def copy_bytes(src, dst, offset, size):
+    # type: (BinaryIO, BinaryIO, int, int) -> None
+    """
+    Copy a range of bytes from one file-like object to the current
+    position of another.
+
+    When both are regular files (see `get_raw_file`), the copy is
+    done within the kernel using `os.sendfile`.  Otherwise, it falls
+    back to a read and write.
+
+    Parameters
+    ----------
+    src : file-like object
+        Must be opened for reading, seekable and in binary mode.  Its
+        position is left unchanged.
+
+    dst : file-like object
+        Must be opened for writing and in binary mode.
+
+    offset : int
+        The offset in *src* to start copying from.
+
+    size : int
+        The number of bytes to copy.
+    """
+    copied = 0
+
+    if (hasattr(os, 'sendfile') and
+            get_raw_file(src) is not None and
+            get_raw_file(dst) is not None):
+        try:
+            src_fileno = src.fileno()
+            dst_fileno = dst.fileno()
+        except (IOError, ValueError):
+            pass
+        else:
+            src.flush()
+            dst.flush()
+            try:
+                while copied < size:
+                    sent = os.sendfile(
+                        dst_fileno, src_fileno, offset + copied,
+                        size - copied)
+                    if sent == 0:
+                        break
+                    copied += sent
+            except OSError:
+                pass
+            # Resynchronize the file object with the OS-level position
+            dst.seek(os.lseek(dst_fileno, 0, os.SEEK_CUR))
+
+    if copied < size:
+        tell = src.tell()
+        try:
+            src.seek(offset + copied)
+            data = src.read(size - copied)
+        finally:
+            src.seek(tell)
+        dst.write(data)
+
+
 _indent = [0]
 
 
@@ -391,6 +535,36 @@ def assert_is_list_of(value, cls, min=None, max=None):
             )
 
 
+def assert_is_list_of_ints(value, min, max):
+    # type: (Any, int, int) -> None
+    """
+    If value is not a list of integers in the range min to max,
+    raises TypeError or ValueError.
+
+    Equivalent to ``assert_is_list_of(value, int, min, max)``, but
+    checks the range with a vectorized Numpy operation, which is much
+    faster on long lists.  A 1-dimensional Numpy array of integers is
+    also accepted.
+    """
+    if isinstance(value, np.ndarray):
+        if value.ndim != 1 or value.dtype.kind not in 'iu':
+            raise TypeError("Must be list of int")
+    elif not isinstance(value, list):
+        raise TypeError("Must be list of int")
+    if len(value) == 0:
+        return
+    arr = np.asarray(value)
+    if arr.dtype.kind not in 'iu':
+        # Not all integers, or too large for a Numpy integer type, so
+        # leave it to the general case to report the error.
+        assert_is_list_of(value, int, min, max)
+        return
+    if arr.min() < min or arr.max() > max:
+        raise ValueError(
+            "All values must be in range {} to {}".format(min, max)
+        )
+
+
 def _get_channel_id(color, color_mode):
     if color not in enums.ColorChannelMapping:
         raise ValueError("Unknown color '{}'".format(color))
@@ -30,6 +30,10 @@ else:
         Extension(
             "pytoshop.packbits",
             ["pytoshop/packbits.pyx"]
+        ),
+        Extension(
+            "pytoshop._cyimage_resources",
+            ["pytoshop/_cyimage_resources.pyx"]
         )
     ])
 
@@ -2,6 +2,7 @@
 
 
 import io
+import zlib
 
 
 import numpy as np
@@ -29,6 +30,23 @@ def test_zip_with_prediction(depth):
     assert_array_equal(x, y)
 
 
+@pytest.mark.parametrize("depth", (8, 16))
+def test_zip_with_prediction_stream(depth):
+    dtype = codecs.color_depth_dtype_map[depth]
+    x = np.array([[1, 3, 2, 7], [0, 0, 5, 5]], dtype=dtype)
+    deltas = np.array([[1, 2, -1, 5], [0, 0, 5, 0]]).astype(dtype)
+
+    fd = io.BytesIO()
+    codecs.compress_image(
+        fd, x, enums.Compression.zip_prediction, (2, 4), 1, depth, 1)
+    assert zlib.decompress(fd.getvalue()) == deltas.tobytes()
+
+    y = codecs.decompress_image(
+        zlib.compress(deltas.tobytes()), enums.Compression.zip_prediction,
+        (2, 4), depth, 1)
+    assert_array_equal(x, y)
+
+
 @pytest.mark.parametrize("depth", (1, 8, 16, 32))
 def test_zip(depth):
     np.random.seed(0)
@@ -127,3 +145,12 @@ def test_rle_constant(depth, version):
         fd.getvalue(), enums.Compression.rle, (255, 256), depth, version)
 
     assert_array_equal(x, y)
+
+
+def test_unknown_compression():
+    with pytest.raises(ValueError):
+        codecs.decompress_image(b'', 4, (1, 1), 8, 1)
+
+    with pytest.raises(ValueError):
+        codecs.compress_image(
+            io.BytesIO(), np.zeros((1, 1), np.uint8), 4, (1, 1), 1, 8, 1)
@@ -2,6 +2,7 @@
 
 
 import glob
+import gzip
 import io
 import os
 
@@ -56,3 +57,28 @@ def test_convert_to_version2(filename):
 
     fd2.seek(0)
     f = pytoshop.PsdFile.read(fd2)
+
+
+@pytest.mark.parametrize("filename", glob.glob(path))
+def test_gzip_roundtrip(filename, tmpdir):
+    # Unchanged layer channels are copied straight from the input.  The
+    # fileno() of a gzip stream is that of the compressed file, so that
+    # copy must not use it.
+    with open(filename, 'rb') as fd:
+        content = fd.read()
+
+    expected = io.BytesIO()
+    pytoshop.read(io.BytesIO(content)).write(expected)
+
+    gz_filename = str(tmpdir.join('input.psd.gz'))
+    with gzip.open(gz_filename, 'wb') as fd:
+        fd.write(content)
+
+    out_filename = str(tmpdir.join('output.psd'))
+    with gzip.open(gz_filename, 'rb') as fd:
+        f = pytoshop.read(fd)
+        with open(out_filename, 'wb') as fd2:
+            f.write(fd2)
+
+    with open(out_filename, 'rb') as fd:
+        assert fd.read() == expected.getvalue()
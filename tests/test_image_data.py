@@ -1,11 +1,15 @@
 # -*- coding: utf-8 -*-
 
 
+import glob
+import gzip
 import inspect
 import io
+import os
 
 
 import numpy as np
+from numpy.testing import assert_array_equal
 import pytest
 
 
@@ -66,3 +70,62 @@ def test_invalid_compression_type():
         image_data.ImageData(compression=4)
     with pytest.raises(ValueError):
         image_data.ImageData(compression='zlib')
+
+
+def test_decode_batch():
+    path = os.path.join(os.path.dirname(__file__), 'psd_files', '*.psd')
+    fds = [open(filename, 'rb') for filename in sorted(glob.glob(path))[:4]]
+    try:
+        image_datas = [pytoshop.read(fd).image_data for fd in fds]
+        image_datas.append(image_data.ImageData(
+            channels=np.ones((3, 4, 5), np.uint8)))
+
+        results = image_data.decode_batch(image_datas, max_workers=2)
+
+        assert len(results) == len(image_datas)
+        for result, data in zip(results, image_datas):
+            assert_array_equal(result, data.channels)
+    finally:
+        for fd in fds:
+            fd.close()
+
+
+def test_decode_batch_without_futures(monkeypatch):
+    monkeypatch.setattr(image_data, 'ProcessPoolExecutor', None)
+
+    path = os.path.join(os.path.dirname(__file__), 'psd_files', '*.psd')
+    filename = sorted(glob.glob(path))[0]
+    with open(filename, 'rb') as fd:
+        image_datas = [pytoshop.read(fd).image_data]
+        results = image_data.decode_batch(image_datas)
+        assert_array_equal(results[0], image_datas[0].channels)
+
+
+def test_decode_batch_wrapped_files(tmpdir):
+    path = os.path.join(os.path.dirname(__file__), 'psd_files', '*.psd')
+    filename = sorted(glob.glob(path))[0]
+    with open(filename, 'rb') as fd:
+        expected = pytoshop.read(fd).image_data.channels
+
+    gz_filename = str(tmpdir.join('image.psd.gz'))
+    with open(filename, 'rb') as fd:
+        with gzip.open(gz_filename, 'wb') as gz:
+            gz.write(fd.read())
+
+    with gzip.open(gz_filename, 'rb') as gz:
+        image_datas = [pytoshop.read(gz).image_data]
+        results = image_data.decode_batch(image_datas, max_workers=2)
+    assert_array_equal(results[0], expected)
+
+    cwd = os.getcwd()
+    os.chdir(os.path.dirname(filename))
+    try:
+        fd = open(os.path.basename(filename), 'rb')
+        image_datas = [pytoshop.read(fd).image_data]
+    finally:
+        os.chdir(cwd)
+    try:
+        results = image_data.decode_batch(image_datas, max_workers=2)
+    finally:
+        fd.close()
+    assert_array_equal(results[0], expected)
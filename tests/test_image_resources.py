@@ -1,9 +1,21 @@
 # -*- coding: utf-8 -*-
 
 
+import copy
+import glob
+import io
+import os
+import pickle
+import struct
+
+
+import numpy as np
 import pytest
 
 
+import pytoshop
+from pytoshop import core
+from pytoshop import enums
 from pytoshop import image_resources
 
 
@@ -30,3 +42,266 @@ def test_image_resources():
 
     with pytest.raises(TypeError):
         r.value = b'bytes'
+
+
+def test_grid_and_guides_info():
+    guides = [
+        image_resources.GuideResourceBlock(
+            location=10, direction=enums.GuideDirection.vertical),
+        image_resources.GuideResourceBlock(
+            location=(1 << 32) - 1, direction=enums.GuideDirection.horizontal)
+    ]
+    r = image_resources.GridAndGuidesInfo(
+        grid_hori=5, grid_vert=6, guides=guides)
+
+    header = core.Header()
+    fd = io.BytesIO()
+    r.write(fd, header)
+    assert len(fd.getvalue()) == r.length(header)
+
+    fd.seek(0)
+    r2 = image_resources.ImageResourceBlock.read(fd, header)
+    assert r2.length(header) == r.length(header)
+
+    fd2 = io.BytesIO()
+    r2.write(fd2, header)
+    assert fd2.getvalue() == fd.getvalue()
+
+    assert r2.grid_hori == 5
+    assert r2.grid_vert == 6
+    assert [(x.location, x.direction) for x in r2.guides] == [
+        (10, 0), ((1 << 32) - 1, 1)]
+
+    fd2 = io.BytesIO()
+    r2.write(fd2, header)
+    assert fd2.getvalue() == fd.getvalue()
+
+    data = bytearray(fd.getvalue())
+    data[-1] = 2
+    with pytest.raises(ValueError):
+        image_resources.ImageResourceBlock.read(io.BytesIO(data), header)
+
+
+def test_alpha_identifiers():
+    r = image_resources.AlphaIdentifiers(identifiers=[1, 2, (1 << 32) - 1])
+
+    header = core.Header()
+    fd = io.BytesIO()
+    r.write(fd, header)
+    assert fd.getvalue().endswith(
+        b'\0\0\0\x03\0\0\0\x01\0\0\0\x02\xff\xff\xff\xff')
+
+    fd.seek(0)
+    r2 = image_resources.ImageResourceBlock.read(fd, header)
+    assert r2.identifiers == [1, 2, (1 << 32) - 1]
+
+
+def test_alpha_identifiers_out_of_range():
+    with pytest.raises(ValueError):
+        image_resources.AlphaIdentifiers(identifiers=[1 << 32])
+
+    r = image_resources.AlphaIdentifiers(identifiers=[(1 << 32) - 1])
+    r.identifiers.append(1 << 32)
+    with pytest.raises(struct.error):
+        r.write(io.BytesIO(), core.Header())
+
+
+def test_print_flags():
+    r = image_resources.PrintFlags(crop_marks=True, print_flags=1)
+    assert r.crop_marks is True
+    assert r.labels is False
+    assert r.print_flags is True
+
+    header = core.Header()
+    fd = io.BytesIO()
+    r.write(fd, header)
+    assert fd.getvalue().endswith(b'\0\xff\0\0\0\0\0\0\xff\0')
+
+    fd.seek(0)
+    r2 = image_resources.ImageResourceBlock.read(fd, header)
+    assert r2.crop_marks is True
+    assert r2.print_flags is True
+    r2.crop_marks = False
+    assert r2.crop_marks is False
+    assert r2.print_flags is True
+
+    for data in (b'\0\1\0\0\0\0\0\0\1', b'\0\2\0\0\0\0\0\0\x80'):
+        r3 = image_resources.PrintFlags.read_data(
+            io.BytesIO(data), 1011, '', 9, header)
+        assert r3.labels is False
+        assert r3.crop_marks is True
+        assert r3.print_flags is True
+
+
+@pytest.mark.parametrize("name", ('', 'a', 'ab', 'abc'))
+@pytest.mark.parametrize("data", (b'', b'x', b'xy'))
+def test_compiled_read_block(name, data):
+    _cyimage_resources = pytest.importorskip('pytoshop._cyimage_resources')
+
+    header = core.Header()
+    fd = io.BytesIO()
+    image_resources.GenericImageResourceBlock(
+        name=name, resource_id=9999, data=data).write(fd, header)
+    image_resources.CopyrightFlag(name=name, copyright=True).write(
+        fd, header)
+    content = fd.getvalue()
+
+    fd = io.BytesIO(content)
+    blocks = [
+        _cyimage_resources.read_block(
+            fd, header, image_resources._ImageResourceBlockMeta.mapping,
+            image_resources.GenericImageResourceBlock)
+        for i in range(2)
+    ]
+    assert fd.tell() == len(content)
+
+    fd = io.BytesIO(content)
+    expected = [
+        image_resources.ImageResourceBlock._read(fd, header)
+        for i in range(2)
+    ]
+
+    for block, expected_block in zip(blocks, expected):
+        assert type(block) is type(expected_block)
+        assert block.name == expected_block.name == name
+        assert block.resource_id == expected_block.resource_id
+    assert blocks[0].data == data
+    assert blocks[1].copyright is True
+
+    with pytest.raises(ValueError):
+        _cyimage_resources.read_block(
+            io.BytesIO(b'8BIX' + content[4:]), header,
+            image_resources._ImageResourceBlockMeta.mapping,
+            image_resources.GenericImageResourceBlock)
+
+    # Truncated input fails the same way in both readers
+    def read_error(reader, data):
+        try:
+            reader(io.BytesIO(data))
+        except Exception as e:
+            return type(e), str(e)
+
+    for end in range(len(content)):
+        truncated = content[:end]
+        error = read_error(
+            lambda fd: _cyimage_resources.read_block(
+                fd, header, image_resources._ImageResourceBlockMeta.mapping,
+                image_resources.GenericImageResourceBlock),
+            truncated)
+        assert error == read_error(
+            lambda fd: image_resources.ImageResourceBlock._read(fd, header),
+            truncated)
+        if end < 12:
+            assert error[0] is ValueError
+
+
+def test_document_specific_ids_seed_number():
+    header = core.Header()
+
+    r = image_resources.DocumentSpecificIdsSeedNumber(base_value=12345)
+    fd = io.BytesIO()
+    r.write(fd, header)
+    fd.seek(0)
+    r2 = image_resources.ImageResourceBlock.read(fd, header)
+    assert r2.base_value == 12345
+
+    fd = io.BytesIO()
+    r2.write(fd, header)
+    assert fd.getvalue().endswith(b'\0\0\x30\x39')
+
+
+def test_background_color():
+    header = core.Header()
+
+    r = image_resources.BackgroundColor(color=[1, 2])
+    fd = io.BytesIO()
+    r.write(fd, header)
+    assert fd.getvalue().endswith(b'\0\0\0\x01\0\x02\0\0\0\0')
+
+    r = image_resources.BackgroundColor(
+        color_space=enums.ColorSpace.lab, color=[10000, -12800, 12700, 0])
+    fd = io.BytesIO()
+    r.write(fd, header)
+    fd.seek(0)
+    r2 = image_resources.ImageResourceBlock.read(fd, header)
+    assert r2.color_space == enums.ColorSpace.lab
+    assert r2.color == [10000, -12800, 12700, 0]
+
+
+@pytest.mark.parametrize('filename', sorted(glob.glob(
+    os.path.join(os.path.dirname(__file__), 'psd_files', '*.psd'))))
+def test_copy_and_pickle(filename):
+    header = core.Header()
+    with open(filename, 'rb') as fd:
+        resources = pytoshop.read(fd).image_resources
+
+    expected = io.BytesIO()
+    resources.write(expected, header)
+
+    for copied in (copy.deepcopy(resources),
+                   pickle.loads(pickle.dumps(resources))):
+        fd = io.BytesIO()
+        copied.write(fd, header)
+        assert fd.getvalue() == expected.getvalue()
+
+
+def test_bytes_like_data():
+    header = core.Header()
+
+    r = image_resources.GenericImageResourceBlock(
+        resource_id=9999, data=bytearray(b'abc'))
+    fd = io.BytesIO()
+    r.write(fd, header)
+    assert r.data == b'abc'
+
+    fd.seek(0)
+    r2 = image_resources.ImageResourceBlock.read(fd, header)
+    assert r2.data == b'abc'
+    assert isinstance(r2.data, bytes)
+
+    r3 = image_resources.Url(url=memoryview(b'http://a'))
+    assert r3.url == b'http://a'
+    assert pickle.loads(pickle.dumps(r3)).url == b'http://a'
+
+    with pytest.raises(ValueError):
+        image_resources.GenericImageResourceBlock(data='abc')
+    with pytest.raises(TypeError):
+        image_resources.Url(url='abc')
+
+
+def test_integer_array_identifiers():
+    header = core.Header()
+
+    r = image_resources.AlphaIdentifiers(
+        identifiers=np.array([1, 2, 3], '>u4'))
+    fd = io.BytesIO()
+    r.write(fd, header)
+    fd.seek(0)
+    assert image_resources.ImageResourceBlock.read(
+        fd, header).identifiers == [1, 2, 3]
+
+    r = image_resources.LayersGroupInfo(group_ids=np.array([4, 5], 'u2'))
+    fd = io.BytesIO()
+    r.write(fd, header)
+    fd.seek(0)
+    assert image_resources.ImageResourceBlock.read(
+        fd, header).group_ids == [4, 5]
+
+
+def test_image_resources_bytes():
+    header = core.Header()
+
+    r = image_resources.ImageResources(blocks=[
+        image_resources.GlobalAngle(angle=30),
+        image_resources.Url(url=b'http://a')
+    ])
+    data = r.to_bytes(header)
+
+    fd = io.BytesIO()
+    r.write(fd, header)
+    assert fd.getvalue() == data
+
+    r2 = image_resources.ImageResources.from_bytes(data, header)
+    assert r2.blocks[0].angle == 30
+    assert r2.blocks[1].url == b'http://a'
+    assert r2.to_bytes(header) == data
@@ -4,6 +4,7 @@
 import inspect
 import io
 import os
+import struct
 
 
 import numpy as np
@@ -87,6 +88,23 @@ def test_futz_with_layer_channels():
                     image=np.empty((200, 100), np.uint8))}
 
 
+def test_channel_image_data_cache():
+    filename = os.path.join(DATA_PATH, 'group.psd')
+    with open(filename, 'rb') as fd:
+        psd = pytoshop.PsdFile.read(fd)
+
+        first_layer = psd.layer_and_mask_info.layer_info.layer_records[0]
+        channel = first_layer.channels[0]
+
+        image = channel.image
+        assert channel.image is image
+
+        channel.invalidate()
+        image2 = channel.image
+        assert image2 is not image
+        np.testing.assert_array_equal(image, image2)
+
+
 def test_layer_mask_invalid_values():
     m = layers.LayerMask()
 
@@ -137,3 +155,56 @@ def test_layer_record_invalid_values():
 
     with pytest.raises(ValueError):
         m.name = u'X' * 256
+
+
+@pytest.mark.parametrize('params', [
+    {},
+    {'user_mask_density': 10},
+    {'user_mask_feather': 1, 'vector_mask_density': 20},
+    {'user_mask_density': 10, 'user_mask_feather': 1,
+     'vector_mask_density': 20, 'vector_mask_feather': 2}])
+def test_layer_mask_parameters_length(params):
+    m = layers.LayerMask(top=1, left=2, bottom=3, right=4, **params)
+    header = pytoshop.core.Header()
+
+    fd = io.BytesIO()
+    m.write(fd, header)
+    assert len(fd.getvalue()) == m.total_length(header)
+
+
+def test_layer_mask_read_parameters():
+    m = layers.LayerMask(
+        top=1, left=2, bottom=3, right=4, default_color=True,
+        layer_mask_disabled=True, user_mask_density=10,
+        vector_mask_density=20, real_flags=5,
+        real_user_mask_background=True, real_top=-5, real_left=6,
+        real_bottom=7, real_right=8)
+
+    fd = io.BytesIO()
+    m.write(fd, pytoshop.core.Header())
+    fd.write(b'next')
+    fd.seek(0)
+
+    m2 = layers.LayerMask.read(fd)
+    assert fd.read() == b'next'
+    for prop in ('top', 'left', 'bottom', 'right', 'default_color',
+                 'layer_mask_disabled', 'user_mask_density',
+                 'user_mask_feather', 'vector_mask_density',
+                 'vector_mask_feather', 'real_flags',
+                 'real_user_mask_background', 'real_top', 'real_left',
+                 'real_bottom', 'real_right'):
+        assert getattr(m2, prop) == getattr(m, prop)
+
+    # A mask that ends before the real flags and rectangle
+    body = (struct.pack(str('>iiiiBB'), 1, 2, 3, 4, 0, 16) +
+            struct.pack(str('>BB'), 1, 10) + b'\0\0')
+    fd = io.BytesIO(struct.pack(str('>I'), len(body)) + body + b'next')
+
+    m3 = layers.LayerMask.read(fd)
+    assert fd.read() == b'next'
+    assert (m3.top, m3.left, m3.bottom, m3.right) == (1, 2, 3, 4)
+    assert m3.user_mask_density == 10
+    assert m3.user_mask_feather is None
+    assert m3.real_flags == 0
+    assert (m3.real_top, m3.real_left, m3.real_bottom, m3.real_right) == (
+        0, 0, 0, 0)
@@ -1,6 +1,11 @@
 # -*- coding: utf-8 -*-
 
 
+import gzip
+import io
+
+
+import numpy as np
 import pytest
 
 
@@ -16,3 +21,88 @@ def test_assert_is_list_of():
 
     with pytest.raises(ValueError):
         util.assert_is_list_of([-1, 9], int, 0, 10)
+
+
+def test_assert_is_list_of_ints():
+    util.assert_is_list_of_ints([], 0, 10)
+    util.assert_is_list_of_ints([0, 5, 10], 0, 10)
+
+    with pytest.raises(TypeError):
+        util.assert_is_list_of_ints((), 0, 10)
+
+    with pytest.raises(TypeError):
+        util.assert_is_list_of_ints(['foo'], 0, 10)
+
+    with pytest.raises(TypeError):
+        util.assert_is_list_of_ints([1, 2.5], 0, 10)
+
+    with pytest.raises(ValueError):
+        util.assert_is_list_of_ints([-1, 9], 0, 10)
+
+    with pytest.raises(ValueError):
+        util.assert_is_list_of_ints([1, 11], 0, 10)
+
+    with pytest.raises(ValueError):
+        util.assert_is_list_of_ints([1, 1 << 70], 0, 10)
+
+    util.assert_is_list_of_ints(np.array([0, 10], '>u4'), 0, 10)
+
+    with pytest.raises(TypeError):
+        util.assert_is_list_of_ints(np.array([1.0]), 0, 10)
+
+    with pytest.raises(TypeError):
+        util.assert_is_list_of_ints(np.zeros((2, 2), int), 0, 10)
+
+    with pytest.raises(ValueError):
+        util.assert_is_list_of_ints(np.array([11], 'u2'), 0, 10)
+
+
+def test_copy_bytes(tmpdir):
+    content = bytes(bytearray(range(256))) * 16
+
+    src_path = str(tmpdir.join('src'))
+    with open(src_path, 'wb') as fd:
+        fd.write(content)
+
+    dst_path = str(tmpdir.join('dst'))
+    with open(src_path, 'rb') as src:
+        src.seek(7)
+        with open(dst_path, 'wb') as dst:
+            dst.write(b'head')
+            util.copy_bytes(src, dst, 100, 3000)
+            dst.write(b'tail')
+        assert src.tell() == 7
+
+        dst = io.BytesIO()
+        util.copy_bytes(src, dst, 100, 3000)
+        assert dst.getvalue() == content[100:3100]
+        assert src.tell() == 7
+
+    with open(dst_path, 'rb') as fd:
+        assert fd.read() == b'head' + content[100:3100] + b'tail'
+
+    src = io.BytesIO(content)
+    dst = io.BytesIO()
+    util.copy_bytes(src, dst, 5, 10)
+    assert dst.getvalue() == content[5:15]
+
+    # The fileno() of a gzip stream is that of the compressed file
+    gz_path = str(tmpdir.join('src.gz'))
+    with gzip.open(gz_path, 'wb') as fd:
+        fd.write(content)
+    with gzip.open(gz_path, 'rb') as src:
+        with open(dst_path, 'wb') as dst:
+            util.copy_bytes(src, dst, 100, 1000)
+    with open(dst_path, 'rb') as fd:
+        assert fd.read() == content[100:1100]
+
+
+def test_advise_sequential(tmpdir):
+    util.advise_sequential(io.BytesIO(b'abc'))
+
+    filename = str(tmpdir.join('file.bin'))
+    with open(filename, 'wb') as fd:
+        fd.write(b'abc')
+    with open(filename, 'rb') as fd:
+        util.advise_sequential(fd)
+        assert fd.read() == b'abc'